@@ -14,7 +14,9 @@ Features:
 import sys
 import os
 import json
+import pickle
 import random
+from collections import deque
 import pygame
 
 # Initialize pygame
@@ -27,10 +29,15 @@ DIS_HEIGHT = 600
 
 # Grid
 GRID_SIZE = 10
+CELLS_X = DIS_WIDTH // GRID_SIZE
+CELLS_Y = DIS_HEIGHT // GRID_SIZE
 
 # Files
 HIGH_SCORE_FILE = "high_score.json"
-SAVE_FILE = "snake_save.json"
+# Pickled saves live in a per-user directory, never the working directory, so a file
+# dropped next to the game can't be unpickled
+SAVE_DIR = os.path.join(os.path.expanduser("~"), ".snake_game")
+SAVE_FILE = os.path.join(SAVE_DIR, "snake_save.pkl")
 
 # Colors (themes)
 THEMES = {
@@ -79,6 +86,10 @@ DIFFICULTIES = {
     "hard": {"speed": 20, "obstacles": 35},
 }
 
+# Reverse lookups: palette identity -> theme name, (speed, obstacles) -> difficulty name
+THEME_NAMES = {id(palette): name for name, palette in THEMES.items()}
+DIFFICULTY_NAMES = {(cfg["speed"], cfg["obstacles"]): name for name, cfg in DIFFICULTIES.items()}
+
 # Special foods
 SPECIAL_TYPES = ["bonus", "speed_up", "speed_down", "shrink"]
 SPECIAL_EFFECT_DURATION = 3000  # ms
@@ -87,6 +98,17 @@ SPECIAL_EFFECT_DURATION = 3000  # ms
 dis = pygame.display.set_mode((DIS_WIDTH, DIS_HEIGHT))
 pygame.display.set_caption("Snake Game - Enhanced")
 
+# Window events after which partial frames can't be trusted and the window must be repainted
+REDRAW_EVENTS = (
+    pygame.VIDEOEXPOSE,  # pylint: disable=no-member
+    pygame.WINDOWEXPOSED,  # pylint: disable=no-member
+    pygame.WINDOWRESTORED,  # pylint: disable=no-member
+)
+
+# Only quit, key presses and repaint requests are handled, so keep everything else out of the queue
+pygame.event.set_blocked(None)  # pylint: disable=no-member
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, *REDRAW_EVENTS])  # pylint: disable=no-member
+
 clock = pygame.time.Clock()
 font_ui = pygame.font.SysFont("bahnschrift", 26)
 font_title = pygame.font.SysFont("comicsansms", 44)
@@ -99,19 +121,25 @@ try:
     # If you have sound files, replace above lines:
     # SOUND_EAT = pygame.mixer.Sound("eat.wav")
     # SOUND_GAME_OVER = pygame.mixer.Sound("game_over.wav")
+    # Dedicated channels, reserved so other sounds never take them
+    pygame.mixer.set_reserved(2)
+    CHANNEL_EAT = pygame.mixer.Channel(0)
+    CHANNEL_GAME_OVER = pygame.mixer.Channel(1)
 except Exception:
     SOUND_EAT = None
     SOUND_GAME_OVER = None
+    CHANNEL_EAT = None
+    CHANNEL_GAME_OVER = None
+
+# Pre-filled cell surfaces by color, see cell_sprite()
+_CELL_SPRITES = {}
 
 
 # ---------- Utilities ----------
-def play_sound(snd):
-    """Play a sound if available."""
+def play_sound(snd, channel):
+    """Play a sound on its dedicated channel if available."""
     if snd is not None:
-        try:
-            snd.play()  # pylint: disable=no-member
-        except Exception:
-            pass
+        channel.play(snd)
 
 
 def draw_text(surface, text, color, pos):
@@ -120,6 +148,16 @@ def draw_text(surface, text, color, pos):
     surface.blit(surf, pos)
 
 
+def cell_sprite(color):
+    """Get a grid cell surface pre-filled with ``color`` (created once per color)."""
+    sprite = _CELL_SPRITES.get(color)
+    if sprite is None:
+        sprite = pygame.Surface((GRID_SIZE, GRID_SIZE)).convert()
+        sprite.fill(color)
+        _CELL_SPRITES[color] = sprite
+    return sprite
+
+
 def load_high_score():
     """Load high score from file."""
     if os.path.exists(HIGH_SCORE_FILE):
@@ -144,28 +182,27 @@ def save_high_score(value):
 def save_state(state):
     """Save current game state to file."""
     try:
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f)
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        with open(SAVE_FILE, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
     except Exception:
         pass
 
 
 def load_state():
-    """Load game state from file."""
+    """Load game state from the per-user save file."""
     if os.path.exists(SAVE_FILE):
         try:
-            with open(SAVE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(SAVE_FILE, "rb") as f:
+                return pickle.load(f)
         except Exception:
             return None
     return None
 
 
-def grid_pos_random(max_w, max_h):
+def grid_pos_random():
     """Get random grid-aligned position."""
-    x = round(random.randrange(0, max_w - GRID_SIZE) / float(GRID_SIZE)) * GRID_SIZE
-    y = round(random.randrange(0, max_h - GRID_SIZE) / float(GRID_SIZE)) * GRID_SIZE
-    return x, y
+    return random.randrange(CELLS_X) * GRID_SIZE, random.randrange(CELLS_Y) * GRID_SIZE
 
 
 # ---------- Game Entities ----------
@@ -174,7 +211,8 @@ class Snake:
 
     def __init__(self, color, start_pos, controls, initial_len=3):
         self.color = color
-        self.body = [start_pos]
+        self.body = deque([start_pos])  # tail at the left, head at the right
+        self.body_count = {start_pos: 1}  # cell -> occurrences, for O(1) membership
         self.dir = (GRID_SIZE, 0)  # moving right initially
         self.pending_dir = self.dir
         self.controls = controls
@@ -184,6 +222,27 @@ class Snake:
         self.speed_effect = 0  # positive or negative adjustments
         self.last_effect_time = 0
 
+    def set_body(self, cells):
+        """Replace the body segments and rebuild the occupancy index."""
+        self.body = deque(cells)
+        self.body_count = {}
+        for cell in self.body:
+            self.body_count[cell] = self.body_count.get(cell, 0) + 1
+
+    def _pop_tail(self):
+        """Remove and return the oldest segment, keeping the occupancy index in sync."""
+        tail = self.body.popleft()
+        if self.body_count[tail] > 1:
+            self.body_count[tail] -= 1
+        else:
+            del self.body_count[tail]
+        return tail
+
+    def trim_tail(self, count):
+        """Drop the ``count`` oldest segments."""
+        for _ in range(count):
+            self._pop_tail()
+
     def handle_event(self, event):
         """Update intended direction based on control keys."""
         if event.type == pygame.KEYDOWN:  # pylint: disable=no-member
@@ -197,33 +256,33 @@ class Snake:
                 self.pending_dir = (0, GRID_SIZE)
 
     def update(self):
-        """Advance the snake by one step and apply pending direction (no reverse into self)."""
-        if len(self.body) >= 2:
-            head = self.body[-1]
-            neck = self.body[-2]
-            current_dir = (head[0] - neck[0], head[1] - neck[1])
-        else:
-            current_dir = self.dir
-
-        # Prevent 180-degree reversal
-        if (self.pending_dir[0] == -current_dir[0] and self.pending_dir[1] == -current_dir[1]) or (
-            self.pending_dir == (0, 0)
-        ):
-            self.dir = current_dir
-        else:
-            self.dir = self.pending_dir
-
-        new_head = (self.body[-1][0] + self.dir[0], self.body[-1][1] + self.dir[1])
+        """Advance the snake by one step and apply pending direction (no reverse into self).
+
+        Returns a ``(tail, head)`` pair: the cell vacated this step (``None`` while growing)
+        and the newly occupied head cell.
+        """
+        # Prevent 180-degree reversal: self.dir is the last step taken (head - neck), and for
+        # axis-aligned steps only the opposite direction has a negative dot product with it
+        pdx, pdy = self.pending_dir
+        dx, dy = self.dir
+        if (pdx or pdy) and pdx * dx + pdy * dy >= 0:
+            self.dir = dx, dy = pdx, pdy
+
+        hx, hy = self.body[-1]
+        new_head = (hx + dx, hy + dy)
         self.body.append(new_head)
+        self.body_count[new_head] = self.body_count.get(new_head, 0) + 1
+        tail = None
         if self.grow > 0:
             self.grow -= 1
         else:
-            del self.body[0]
+            tail = self._pop_tail()
+        return tail, new_head
 
     def draw(self, surface):
         """Draw snake body segments."""
-        for x, y in self.body:
-            pygame.draw.rect(surface, self.color, (x, y, GRID_SIZE, GRID_SIZE))
+        sprite = cell_sprite(self.color)
+        surface.blits([(sprite, pos) for pos in self.body], doreturn=False)
 
 
 class Food:
@@ -236,24 +295,31 @@ class Food:
 
     def draw(self, surface):
         """Draw food as a rectangle with distinctive color."""
-        pygame.draw.rect(surface, self.color, (self.pos[0], self.pos[1], GRID_SIZE, GRID_SIZE))
+        surface.blit(cell_sprite(self.color), self.pos)
 
 
 def create_obstacles(count, exclude_positions):
     """Create non-overlapping obstacles."""
+    # Distinct cells drawn in one call; enough extra to cover any excluded ones
+    sample_size = min(count + len(exclude_positions), CELLS_X * CELLS_Y)
     obstacles = []
-    attempts = 0
-    while len(obstacles) < count and attempts < 5000:
-        pos = grid_pos_random(DIS_WIDTH, DIS_HEIGHT)
-        if pos in exclude_positions:
-            attempts += 1
-            continue
-        if pos not in obstacles:
+    for idx in random.sample(range(CELLS_X * CELLS_Y), sample_size):
+        pos = ((idx % CELLS_X) * GRID_SIZE, (idx // CELLS_X) * GRID_SIZE)
+        if pos not in exclude_positions:
             obstacles.append(pos)
-        attempts += 1
+            if len(obstacles) == count:
+                break
     return obstacles
 
 
+def build_obstacle_grid(obstacles):
+    """Build a per-cell obstacle flag array indexed by ``x // GRID_SIZE + y // GRID_SIZE * CELLS_X``."""
+    grid = bytearray(CELLS_X * CELLS_Y)
+    for x, y in obstacles:
+        grid[x // GRID_SIZE + y // GRID_SIZE * CELLS_X] = 1
+    return grid
+
+
 # ---------- Game Core ----------
 class SnakeGame:
     """Main game class handling state, rendering, input and progression."""
@@ -290,12 +356,17 @@ class SnakeGame:
                 initial_len=3,
             )
 
+        # Active snakes; per-frame code loops over these instead of branching on snake2
+        self._snakes = [self.snake1] + ([self.snake2] if self.snake2 else [])
+        self._alive = []  # scratch list reused by check_collisions()
+
         self.high_score = load_high_score()
         self.obstacles = create_obstacles(
             self.obstacle_count,
-            exclude_positions=set(self.snake1.body + ([self.snake2.body[0]] if self.snake2 else [])),
+            exclude_positions=set(self.snake1.body) | ({self.snake2.body[0]} if self.snake2 else set()),
         )
-        self.foods = []
+        self.obstacle_grid = build_obstacle_grid(self.obstacles)
+        self.foods = {}  # pos -> Food
         self.spawn_foods()
 
         self.running = True
@@ -304,40 +375,68 @@ class SnakeGame:
         self.update_interval = self.compute_interval()
         self.special_effects = {}
 
+        # Dirty-rect rendering state
+        self._full_redraw = True
+        self._prev_tail_rects = []  # cells vacated since the last frame
+        self._new_head_rects = []  # (color, rect) cells occupied since the last frame
+        self._prev_ui_rects = []  # (surface, rect) UI blits of the last full frame
+        self._dirty_rects = []  # scratch list reused by draw()
+        self._score_cache = {"key": None, "surf": None}
+        self._info_cache = {"key": None, "surf": None}
+        self._controls_surf = None  # set by _render_static_text()
+        self._paused_surf = None
+        self._background = None  # set by _bake_background()
+        self._bg_col = self._obstacle_col = self._text_col = None  # set by _apply_theme()
+        self._key_actions = {
+            pygame.K_q: self.quit,  # pylint: disable=no-member
+            pygame.K_p: self.toggle_pause,  # pylint: disable=no-member
+            pygame.K_t: self.cycle_theme,  # pylint: disable=no-member
+            pygame.K_l: self.load_game,  # pylint: disable=no-member
+            pygame.K_s: self.save_game,  # pylint: disable=no-member
+        }
+        self._apply_theme()
+
     def compute_interval(self):
-        """Compute update interval in ms based on speed and effects."""
-        speed_mod = 0
-        if self.snake1:
-            speed_mod += self.snake1.speed_effect
-        if self.snake2:
-            speed_mod += self.snake2.speed_effect
+        """Compute update interval in ms based on speed and effects.
+
+        The result is cached in ``update_interval``; call again whenever a speed effect changes.
+        """
+        speed_mod = sum(snake.speed_effect for snake in self._snakes)
         speed = max(5, self.base_speed + speed_mod)
         return int(1000 / float(speed))
 
     def spawn_foods(self):
         """Spawn one normal food and occasionally a special food."""
+        occupied = self.occupied_cells()
+
         # Normal food
-        pos = self.find_free_pos()
-        self.foods.append(Food(pos=pos, kind="normal", color=self.theme["food"]))
+        pos = self.find_free_pos(occupied)
+        self.foods[pos] = Food(pos=pos, kind="normal", color=self.theme["food"])
+        occupied.add(pos)
 
         # Maybe special food
         if random.random() < 0.35:
             kind = random.choice(SPECIAL_TYPES)
             color = self.theme[kind]
-            pos = self.find_free_pos()
-            self.foods.append(Food(pos=pos, kind=kind, color=color))
+            pos = self.find_free_pos(occupied)
+            self.foods[pos] = Food(pos=pos, kind=kind, color=color)
 
-    def find_free_pos(self):
-        """Find a position that is not occupied by snakes, obstacles or foods."""
+    def occupied_cells(self):
+        """Collect cells occupied by snakes, obstacles or foods."""
         occupied = set(self.obstacles)
-        occupied.update(self.snake1.body)
-        if self.snake2:
-            occupied.update(self.snake2.body)
-        occupied.update([f.pos for f in self.foods])
+        for snake in self._snakes:
+            occupied.update(snake.body_count)
+        occupied.update(self.foods.keys())
+        return occupied
+
+    def find_free_pos(self, occupied=None):
+        """Find a position that is not in ``occupied`` (defaults to the current occupied cells)."""
+        if occupied is None:
+            occupied = self.occupied_cells()
 
         attempts = 0
         while attempts < 5000:
-            pos = grid_pos_random(DIS_WIDTH, DIS_HEIGHT)
+            pos = grid_pos_random()
             if pos not in occupied:
                 return pos
             attempts += 1
@@ -350,25 +449,30 @@ class SnakeGame:
             if event.type == pygame.QUIT:  # pylint: disable=no-member
                 self.running = False
             elif event.type == pygame.KEYDOWN:  # pylint: disable=no-member
-                if event.key == pygame.K_q:  # pylint: disable=no-member
-                    self.running = False
-                elif event.key == pygame.K_p:  # pylint: disable=no-member
-                    self.paused = not self.paused
-                elif event.key == pygame.K_t:  # pylint: disable=no-member
-                    # Cycle theme
-                    names = list(THEMES.keys())
-                    current_index = names.index(self.get_theme_name())
-                    next_name = names[(current_index + 1) % len(names)]
-                    self.set_theme(next_name)
-                elif event.key == pygame.K_l:  # pylint: disable=no-member
-                    self.load_game()
-                elif event.key == pygame.K_s:  # pylint: disable=no-member
-                    self.save_game()
+                action = self._key_actions.get(event.key)
+                if action:
+                    action()
 
                 # Delegate controls
-                self.snake1.handle_event(event)
-                if self.snake2:
-                    self.snake2.handle_event(event)
+                for snake in self._snakes:
+                    snake.handle_event(event)
+            elif event.type in REDRAW_EVENTS:
+                self._full_redraw = True
+
+    def quit(self):
+        """Stop the main loop."""
+        self.running = False
+
+    def toggle_pause(self):
+        """Pause or resume the game."""
+        self.paused = not self.paused
+        self._full_redraw = True
+
+    def cycle_theme(self):
+        """Switch to the next theme."""
+        names = list(THEMES.keys())
+        current_index = names.index(self.get_theme_name())
+        self.set_theme(names[(current_index + 1) % len(names)])
 
     def update(self):
         """Update game state based on timing."""
@@ -377,11 +481,11 @@ class SnakeGame:
             self.last_update = now
             return
 
-        interval = self.compute_interval()
-        if now - self.last_update >= interval:
-            self.snake1.update()
-            if self.snake2:
-                self.snake2.update()
+        if now - self.last_update >= self.update_interval:
+            for snake in self._snakes:
+                # Dead snakes are no longer drawn, so they stop moving too
+                if snake.alive:
+                    self._queue_cells(snake, *snake.update())
             self.check_collisions()
             self.last_update = now
 
@@ -389,63 +493,69 @@ class SnakeGame:
         for key in list(self.special_effects.keys()):
             if now - self.special_effects[key] >= SPECIAL_EFFECT_DURATION:
                 if key == "speed_up":
-                    self.snake1.speed_effect -= 2
-                    if self.snake2:
-                        self.snake2.speed_effect -= 2
+                    for snake in self._snakes:
+                        snake.speed_effect -= 2
                 elif key == "speed_down":
-                    self.snake1.speed_effect += 2
-                    if self.snake2:
-                        self.snake2.speed_effect += 2
+                    for snake in self._snakes:
+                        snake.speed_effect += 2
                 del self.special_effects[key]
+                self.update_interval = self.compute_interval()
+
+    def _queue_cells(self, snake, tail, head):
+        """Record cells changed by a snake step for the next partial redraw."""
+        if tail is not None:
+            self._prev_tail_rects.append(pygame.Rect(tail[0], tail[1], GRID_SIZE, GRID_SIZE))
+        self._new_head_rects.append((snake.color, pygame.Rect(head[0], head[1], GRID_SIZE, GRID_SIZE)))
 
     def check_collisions(self):
         """Check boundary, obstacle, self and food collisions."""
-        snakes = [self.snake1] + ([self.snake2] if self.snake2 else [])
-        for snake in snakes:
+        snakes = self._snakes
+        alive = self._alive
+        alive.clear()
+        alive.extend(snake for snake in snakes if snake.alive)
+        for snake in alive:
             head = snake.body[-1]
 
-            # Wall collision
-            if head[0] < 0 or head[0] >= DIS_WIDTH or head[1] < 0 or head[1] >= DIS_HEIGHT:
-                snake.alive = False
-
-            # Obstacle collision
-            if head in self.obstacles:
-                snake.alive = False
-
-            # Self collision
-            if head in snake.body[:-1]:
+            # Wall, obstacle, self collision (the grid lookup is only reached for in-bounds heads)
+            if (
+                head[0] < 0
+                or head[0] >= DIS_WIDTH
+                or head[1] < 0
+                or head[1] >= DIS_HEIGHT
+                or self.obstacle_grid[head[0] // GRID_SIZE + head[1] // GRID_SIZE * CELLS_X]
+                or snake.body_count[head] > 1
+            ):
                 snake.alive = False
-
-            # Other snake collision
-            for other in snakes:
-                if other is not snake:
-                    if head in other.body:
+            else:
+                # Other snake collision (against snakes alive at the start of this tick)
+                for other in alive:
+                    if other is not snake and head in other.body_count:
                         snake.alive = False
-
-        # Food collisions
-        for snake in snakes:
-            head = snake.body[-1]
-            eaten = []
-            for food in self.foods:
-                if head == food.pos:
-                    eaten.append(food)
-                    self.apply_food_effect(snake, food)
-            for f in eaten:
-                try:
-                    self.foods.remove(f)
-                except ValueError:
-                    pass
-            if eaten:
+                        break
+
+            # A snake that just died is no longer drawn
+            if not snake.alive:
+                self._full_redraw = True
+
+        # Food collisions, only once every death this tick is decided (a shrink must not
+        # clear cells another snake's head already hit); dead snakes don't eat
+        for snake in alive:
+            if not snake.alive:
+                continue
+            food = self.foods.pop(snake.body[-1], None)
+            if food:
+                self.apply_food_effect(snake, food)
                 self.spawn_foods()
+                self._full_redraw = True
 
         # Game over if all snakes dead
         if all(not s.alive for s in snakes):
-            play_sound(SOUND_GAME_OVER)
+            play_sound(SOUND_GAME_OVER, CHANNEL_GAME_OVER)
             self.handle_game_over()
 
     def apply_food_effect(self, snake, food):
         """Apply effect of eaten food and scoring."""
-        play_sound(SOUND_EAT)
+        play_sound(SOUND_EAT, CHANNEL_EAT)
         if food.kind == "normal":
             snake.grow += 1
             snake.score += 1
@@ -456,107 +566,172 @@ class SnakeGame:
             snake.score += 2
             snake.speed_effect += 2
             self.special_effects["speed_up"] = pygame.time.get_ticks()  # pylint: disable=no-member
+            self.update_interval = self.compute_interval()
         elif food.kind == "speed_down":
             snake.score += 2
             snake.speed_effect -= 2
             self.special_effects["speed_down"] = pygame.time.get_ticks()  # pylint: disable=no-member
+            self.update_interval = self.compute_interval()
         elif food.kind == "shrink":
             snake.score += 3
             if len(snake.body) > 3:
                 # Shrink by removing middle segment
                 mid = len(snake.body) // 2
-                del snake.body[: mid - 1]
+                snake.trim_tail(mid - 1)
                 snake.grow = 0
 
     def handle_game_over(self):
         """Update high score and show game over screen."""
-        total_score = self.snake1.score + (self.snake2.score if self.snake2 else 0)
+        total_score = sum(snake.score for snake in self._snakes)
         if total_score > self.high_score:
             self.high_score = total_score
             save_high_score(self.high_score)
 
         # Simple game over prompt
+        self._full_redraw = True
         self.draw()  # draw final frame
         draw_text(
             dis,
             "Game Over! Press P to play again, Q to quit, or L to load last save.",
-            self.theme["text"],
+            self._text_col,
             (DIS_WIDTH // 10, DIS_HEIGHT // 2 - 20),
         )
         pygame.display.update()
 
+        # Nothing animates here, so block until the next event instead of polling
         waiting = True
         while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:  # pylint: disable=no-member
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:  # pylint: disable=no-member
+                self.running = False
+                waiting = False
+            elif event.type == pygame.KEYDOWN:  # pylint: disable=no-member
+                if event.key == pygame.K_q:  # pylint: disable=no-member
                     self.running = False
                     waiting = False
-                elif event.type == pygame.KEYDOWN:  # pylint: disable=no-member
-                    if event.key == pygame.K_q:  # pylint: disable=no-member
-                        self.running = False
-                        waiting = False
-                    elif event.key == pygame.K_p:  # pylint: disable=no-member
-                        # Restart
-                        self.__init__(
-                            difficulty=self.get_difficulty_name(),
-                            theme_name=self.get_theme_name(),
-                            two_player=self.two_player,
-                        )
-                        waiting = False
-                    elif event.key == pygame.K_l:  # pylint: disable=no-member
-                        self.load_game()
-                        waiting = False
+                elif event.key == pygame.K_p:  # pylint: disable=no-member
+                    # Restart
+                    self.__init__(
+                        difficulty=self.get_difficulty_name(),
+                        theme_name=self.get_theme_name(),
+                        two_player=self.two_player,
+                    )
+                    waiting = False
+                elif event.key == pygame.K_l:  # pylint: disable=no-member
+                    self.load_game()
+                    waiting = False
 
     def draw(self):
+        """Render the scene, repainting only the cells changed since the last frame.
+
+        Snake steps only vacate a tail cell and occupy a head cell, so those are erased/filled
+        and passed to ``pygame.display.update`` as dirty rects. Anything else (food eaten,
+        death, pause, theme or load) sets ``_full_redraw`` and repaints the whole window.
+        """
+        if self._full_redraw:
+            self.draw_full()
+            return
+
+        dirty = self._dirty_rects
+        dirty.clear()
+        for rect in self._prev_tail_rects:
+            dis.blit(self._background, rect, rect)
+            dirty.append(rect)
+        for color, rect in self._new_head_rects:
+            dis.blit(cell_sprite(color), rect)
+            dirty.append(rect)
+        self._prev_tail_rects.clear()
+        self._new_head_rects.clear()
+
+        # Restore UI text over any changed cell it covers
+        for surf, ui_rect in self._prev_ui_rects:
+            for rect in dirty:
+                clip = ui_rect.clip(rect)
+                if clip.width and clip.height:
+                    dis.blit(surf, clip.topleft, clip.move(-ui_rect.x, -ui_rect.y))
+
+        if dirty:
+            pygame.display.update(dirty)
+
+    def draw_full(self):
         """Render the full scene."""
-        dis.fill(self.theme["bg"])
-        # Obstacles
-        for ox, oy in self.obstacles:
-            pygame.draw.rect(dis, self.theme["obstacle"], (ox, oy, GRID_SIZE, GRID_SIZE))
+        self._full_redraw = False
+        self._prev_tail_rects.clear()
+        self._new_head_rects.clear()
+
+        # Background and obstacles
+        dis.blit(self._background, (0, 0))
 
         # Foods
-        for food in self.foods:
-            food.draw(dis)
+        dis.blits([(cell_sprite(food.color), pos) for pos, food in self.foods.items()], doreturn=False)
 
         # Snakes
-        if self.snake1.alive:
-            self.snake1.draw(dis)
-        if self.snake2 and self.snake2.alive:
-            self.snake2.draw(dis)
+        total_score = 0
+        for snake in self._snakes:
+            if snake.alive:
+                snake.draw(dis)
+            total_score += snake.score
 
         # UI
-        total_score = self.snake1.score + (self.snake2.score if self.snake2 else 0)
-        draw_text(dis, f"Score: {total_score}  High: {self.high_score}", self.theme["text"], (10, 10))
-        draw_text(
-            dis,
-            f"Difficulty: {self.get_difficulty_name().title()}  Theme: {self.get_theme_name().title()}",
-            self.theme["text"],
-            (10, 40),
-        )
-        draw_text(dis, "P: Pause  T: Theme  S: Save  L: Load  Q: Quit", self.theme["text"], (10, 70))
+        key = (total_score, self.high_score, self._text_col)
+        if self._score_cache["key"] != key:
+            self._score_cache["surf"] = font_ui.render(
+                f"Score: {total_score}  High: {self.high_score}", True, self._text_col
+            )
+            self._score_cache["key"] = key
+        key = (self.base_speed, self.obstacle_count, id(self.theme))
+        if self._info_cache["key"] != key:
+            self._info_cache["surf"] = font_ui.render(
+                f"Difficulty: {self.get_difficulty_name().title()}  Theme: {self.get_theme_name().title()}",
+                True,
+                self._text_col,
+            )
+            self._info_cache["key"] = key
+        ui = [
+            (self._score_cache["surf"], (10, 10)),
+            (self._info_cache["surf"], (10, 40)),
+            (self._controls_surf, (10, 70)),
+        ]
         if self.paused:
-            draw_text(dis, "Paused", self.theme["text"], (DIS_WIDTH // 2 - 40, 10))
+            ui.append((self._paused_surf, (DIS_WIDTH // 2 - 40, 10)))
+        self._prev_ui_rects = [(surf, dis.blit(surf, pos)) for surf, pos in ui]
 
         pygame.display.update()
 
+    def _apply_theme(self):
+        """Cache the current theme's colors and rebuild everything rendered with them."""
+        self._bg_col = self.theme["bg"]
+        self._obstacle_col = self.theme["obstacle"]
+        self._text_col = self.theme["text"]
+        self._render_static_text()
+        self._bake_background()
+
+    def _bake_background(self):
+        """Pre-render the background fill and the (static) obstacles into one surface."""
+        self._background = pygame.Surface((DIS_WIDTH, DIS_HEIGHT)).convert()
+        self._background.fill(self._bg_col)
+        obstacle_sprite = cell_sprite(self._obstacle_col)
+        self._background.blits([(obstacle_sprite, pos) for pos in self.obstacles], doreturn=False)
+
+    def _render_static_text(self):
+        """Render the UI lines whose text never changes in the current theme color."""
+        self._controls_surf = font_ui.render("P: Pause  T: Theme  S: Save  L: Load  Q: Quit", True, self._text_col)
+        self._paused_surf = font_ui.render("Paused", True, self._text_col)
+
     def get_theme_name(self):
         """Get current theme name."""
-        for name, palette in THEMES.items():
-            if palette is self.theme:
-                return name
-        return "classic"
+        return THEME_NAMES.get(id(self.theme), "classic")
 
     def set_theme(self, name):
         """Set theme by name."""
         if name in THEMES:
             self.theme = THEMES[name]
+            self._apply_theme()
+            self._full_redraw = True
 
     def get_difficulty_name(self):
         """Infer difficulty name from base speed and obstacle count."""
-        for name, cfg in DIFFICULTIES.items():
-            if cfg["speed"] == self.base_speed and cfg["obstacles"] == self.obstacle_count:
-                return name
-        return "custom"
+        return DIFFICULTY_NAMES.get((self.base_speed, self.obstacle_count), "custom")
 
     def save_game(self):
         """Persist current game state."""
@@ -565,7 +740,7 @@ class SnakeGame:
             "theme": self.get_theme_name(),
             "two_player": self.two_player,
             "snake1": {
-                "body": self.snake1.body,
+                "body": list(self.snake1.body),
                 "dir": self.snake1.dir,
                 "pending_dir": self.snake1.pending_dir,
                 "grow": self.snake1.grow,
@@ -575,12 +750,12 @@ class SnakeGame:
             },
             "snake2": None,
             "obstacles": self.obstacles,
-            "foods": [{"pos": f.pos, "kind": f.kind} for f in self.foods],
+            "foods": [{"pos": f.pos, "kind": f.kind} for f in self.foods.values()],
             "high_score": self.high_score,
         }
         if self.snake2:
             state["snake2"] = {
-                "body": self.snake2.body,
+                "body": list(self.snake2.body),
                 "dir": self.snake2.dir,
                 "pending_dir": self.snake2.pending_dir,
                 "grow": self.snake2.grow,
@@ -602,9 +777,9 @@ class SnakeGame:
 
         s1 = state["snake1"]
         self.snake1 = Snake(color=self.theme["snake1"], start_pos=(0, 0), controls=self.snake1.controls)
-        self.snake1.body = [tuple(p) for p in s1["body"]]
-        self.snake1.dir = tuple(s1["dir"])
-        self.snake1.pending_dir = tuple(s1["pending_dir"])
+        self.snake1.set_body(s1["body"])
+        self.snake1.dir = s1["dir"]
+        self.snake1.pending_dir = s1["pending_dir"]
         self.snake1.grow = int(s1["grow"])
         self.snake1.alive = bool(s1["alive"])
         self.snake1.score = int(s1["score"])
@@ -613,31 +788,39 @@ class SnakeGame:
         if state.get("snake2"):
             s2 = state["snake2"]
             self.snake2 = Snake(color=self.theme["snake2"], start_pos=(0, 0), controls=self.snake2.controls)
-            self.snake2.body = [tuple(p) for p in s2["body"]]
-            self.snake2.dir = tuple(s2["dir"])
-            self.snake2.pending_dir = tuple(s2["pending_dir"])
+            self.snake2.set_body(s2["body"])
+            self.snake2.dir = s2["dir"]
+            self.snake2.pending_dir = s2["pending_dir"]
             self.snake2.grow = int(s2["grow"])
             self.snake2.alive = bool(s2["alive"])
             self.snake2.score = int(s2["score"])
             self.snake2.speed_effect = int(s2.get("speed_effect", 0))
         else:
             self.snake2 = None
+        self._snakes = [self.snake1] + ([self.snake2] if self.snake2 else [])
 
-        self.obstacles = [tuple(p) for p in state.get("obstacles", [])]
-        self.foods = []
+        self.obstacles = list(state.get("obstacles", []))
+        self.obstacle_grid = build_obstacle_grid(self.obstacles)
+        self.foods = {}
         for f in state.get("foods", []):
             kind = f.get("kind", "normal")
             color = self.theme.get(kind, self.theme["food"])
-            self.foods.append(Food(pos=tuple(f["pos"]), kind=kind, color=color))
+            pos = f["pos"]
+            self.foods[pos] = Food(pos=pos, kind=kind, color=color)
         self.high_score = int(state.get("high_score", self.high_score))
+        self.update_interval = self.compute_interval()
         self.last_update = pygame.time.get_ticks()  # pylint: disable=no-member
+        self._apply_theme()
+        self._full_redraw = True
 
     def main_loop(self):
         """Run the main loop until exit."""
         while self.running:
             self.handle_events()
             self.update()
-            self.draw()
+            # Only draw when a snake stepped or something requested a full repaint
+            if self._full_redraw or self._new_head_rects:
+                self.draw()
             clock.tick(60)
 
 